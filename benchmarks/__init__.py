@@ -0,0 +1,3 @@
+"""
+Benchmarks for HackTracker Lambda handlers
+"""
@@ -0,0 +1,20 @@
+"""
+Pytest configuration for Lambda handler benchmarks
+
+Re-exports the shared fixtures from tests/conftest.py so benchmarks run
+against the same mocked DynamoDB table and event builders as the unit tests,
+including the guard that fails a run which mutates a shared authorizer.
+"""
+
+from tests.conftest import (  # noqa: F401
+    aws_credentials,
+    _session_dynamodb_table,
+    dynamodb_table,
+    sample_user_id,
+    sample_team_id,
+    sample_timestamp,
+    api_event_builder,
+    cognito_event_builder,
+    mock_context,
+    _jwt_authorizers_unmodified,
+)
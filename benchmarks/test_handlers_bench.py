@@ -0,0 +1,77 @@
+"""
+Benchmarks for hot Lambda handler paths
+
+Guards against silent regressions (extra imports, extra get_table work,
+added allocations) in the handlers invoked on nearly every app session:
+- PUT /teams/{teamId}
+- GET /users/context
+- Cognito post-confirmation (create user)
+
+Not collected by a plain `pytest` run (testpaths = tests). Run with:
+    make test-bench
+"""
+
+import itertools
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture(scope='module')
+def update_team_handler():
+    from src.teams.update.handler import handler as lambda_handler
+    return lambda_handler
+
+
+@pytest.fixture(scope='module')
+def user_context_handler():
+    from src.users.context.handler import handler as lambda_handler
+    return lambda_handler
+
+
+@pytest.fixture(scope='module')
+def create_user_handler():
+    from src.users.create.handler import handler as lambda_handler
+    return lambda_handler
+
+
+def test_update_team_bench(benchmark, update_team_handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_team_id, sample_timestamp):
+    """Benchmark PUT /teams/{teamId} for a team owner"""
+    team = {'PK': f'TEAM#{sample_team_id}', 'SK': 'METADATA', 'teamId': sample_team_id, 'name': 'Old Name', 'ownerId': sample_user_id, 'status': 'active', 'team_type': 'MANAGED', 'createdAt': sample_timestamp, 'updatedAt': sample_timestamp}
+    membership = {'PK': f'USER#{sample_user_id}', 'SK': f'TEAM#{sample_team_id}', 'userId': sample_user_id, 'teamId': sample_team_id, 'role': 'owner', 'status': 'active'}
+    dynamodb_table.put_item(Item=team)
+    dynamodb_table.put_item(Item=membership)
+
+    event = api_event_builder(method='PUT', path=f'/teams/{sample_team_id}', path_parameters={'teamId': sample_team_id}, body={'name': 'New Name'}, user_id=sample_user_id)
+
+    with patch('src.teams.update.handler.get_table', return_value=dynamodb_table):
+        result = benchmark(update_team_handler, event, mock_context)
+
+    assert result['statusCode'] == 200
+
+
+def test_user_context_bench(benchmark, user_context_handler, dynamodb_table, api_event_builder, mock_context, sample_user_id):
+    """Benchmark GET /users/context for a user with a personal team"""
+    dynamodb_table.put_item(Item={'PK': f'USER#{sample_user_id}', 'SK': 'TEAM#team-personal', 'userId': sample_user_id, 'teamId': 'team-personal', 'role': 'owner', 'status': 'active'})
+    dynamodb_table.put_item(Item={'PK': 'TEAM#team-personal', 'SK': 'METADATA', 'teamId': 'team-personal', 'name': 'Default', 'team_type': 'PERSONAL', 'status': 'active'})
+
+    event = api_event_builder(method='GET', path='/users/context', user_id=sample_user_id)
+
+    with patch('src.users.context.handler.get_table', return_value=dynamodb_table):
+        result = benchmark(user_context_handler, event, mock_context)
+
+    assert result['statusCode'] == 200
+
+
+def test_create_user_bench(benchmark, create_user_handler, dynamodb_table, cognito_event_builder, mock_context):
+    """Benchmark the Cognito post-confirmation trigger with a new user per round"""
+    counter = itertools.count()
+
+    def setup():
+        user_id = f'user-bench-{next(counter)}'
+        return (cognito_event_builder(user_id=user_id, email=f'{user_id}@example.com'), mock_context), {}
+
+    with patch('src.users.create.handler.get_table', return_value=dynamodb_table):
+        benchmark.pedantic(create_user_handler, setup=setup, rounds=50)
+
+    response = dynamodb_table.get_item(Key={'PK': 'USER#user-bench-0', 'SK': 'METADATA'})
+    assert 'Item' in response
@@ -7,12 +7,24 @@ This module provides shared fixtures for testing Lambda functions including:
 - Common test data
 """
 
+import functools
+import json
 import os
+from types import SimpleNamespace
 import pytest
 import boto3
+from unittest.mock import MagicMock
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+import moto
 from moto import mock_aws
 from datetime import datetime, timezone
 
+try:
+    from orjson import loads as _decode_json
+except ImportError:
+    _decode_json = json.JSONDecoder().decode
+
 
 # Set environment variables for testing
 os.environ['TABLE_NAME'] = 'HackTracker-test'
@@ -20,7 +32,7 @@ os.environ['ENVIRONMENT'] = 'test'
 os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def aws_credentials():
     """Mocked AWS Credentials for moto."""
     os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
@@ -29,9 +41,14 @@ def aws_credentials():
     os.environ['AWS_SESSION_TOKEN'] = 'testing'
 
 
-@pytest.fixture
-def dynamodb_table(aws_credentials):
-    """Create a mocked DynamoDB table for testing."""
+@pytest.fixture(scope='session')
+def _session_dynamodb_table(aws_credentials):
+    """
+    Create the mocked DynamoDB table once per test session.
+    
+    Table and GSI creation dominates moto's per-test cost, so the table is
+    shared and emptied between tests by the dynamodb_table fixture instead.
+    """
     with mock_aws():
         dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
         
@@ -104,25 +121,126 @@ def dynamodb_table(aws_credentials):
         yield table
 
 
+def _clear_table(table):
+    """Delete every item in the table, one key-only scan page at a time."""
+    scan_kwargs = {'ProjectionExpression': 'PK, SK'}
+    while True:
+        response = table.scan(**scan_kwargs)
+        with table.batch_writer() as batch:
+            for key in response['Items']:
+                batch.delete_item(Key=key)
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
 @pytest.fixture
+def dynamodb_table(_session_dynamodb_table):
+    """Mocked DynamoDB table for testing, emptied after each test."""
+    yield _session_dynamodb_table
+    _clear_table(_session_dynamodb_table)
+
+
+@pytest.fixture(scope='session')
+def dynamodb_client(_session_dynamodb_table):
+    """
+    Low-level DynamoDB client for the mocked table.
+    
+    Created separately from the table resource: a resource's own client
+    serializes items itself, so it would double-wrap pre-serialized ones.
+    """
+    return boto3.client('dynamodb', region_name='us-east-1')
+
+
+_serializer = TypeSerializer()
+
+# BatchWriteItem accepts at most 25 put/delete requests per call
+_BATCH_WRITE_LIMIT = 25
+
+
+def batch_put_items(client, table_name, items):
+    """
+    Write items with the low-level client, skipping the Table resource layer.
+    
+    Args:
+        client: boto3 DynamoDB client
+        table_name: Target table name
+        items: Plain Python item dicts
+    """
+    requests = [
+        {'PutRequest': {'Item': _serializer.serialize(item)['M']}}
+        for item in items
+    ]
+    for start in range(0, len(requests), _BATCH_WRITE_LIMIT):
+        client.batch_write_item(
+            RequestItems={table_name: requests[start:start + _BATCH_WRITE_LIMIT]}
+        )
+
+
+# Direct backend seeding relies on moto internals; only trust the major
+# version it was written against and fall back to BatchWriteItem otherwise.
+_MOTO_BACKEND_SEEDING = moto.__version__.split('.')[0] == '5'
+
+
+def moto_put_items(table_name, items):
+    """
+    Insert items straight into moto's in-memory DynamoDB backend.
+    
+    Skips botocore request serialization and moto's request dispatch
+    entirely; moto still indexes the items for GSI queries.
+    
+    Args:
+        table_name: Target table name
+        items: Plain Python item dicts
+    """
+    from moto.core import DEFAULT_ACCOUNT_ID
+    from moto.dynamodb.models import dynamodb_backends
+    
+    table = dynamodb_backends[DEFAULT_ACCOUNT_ID]['us-east-1'].get_table(table_name)
+    for item in items:
+        table.put_item(_serializer.serialize(item)['M'], overwrite=True)
+
+
+@pytest.fixture
+def seed_items(request, dynamodb_table):
+    """
+    Fixture that bulk-writes items into the (per-test emptied) mocked table.
+    
+    dynamodb_client is only requested on the BatchWriteItem fallback, so
+    moto 5 runs never create a client they would not use.
+    """
+    if _MOTO_BACKEND_SEEDING:
+        def _seed(items):
+            moto_put_items(dynamodb_table.name, items)
+    else:
+        client = request.getfixturevalue('dynamodb_client')
+        
+        def _seed(items):
+            batch_put_items(client, dynamodb_table.name, items)
+    return _seed
+
+
+# Sample IDs are fixed constants. That is safe under pytest-xdist: each worker
+# is a separate process with its own moto backend, so IDs never collide.
+@pytest.fixture(scope='session')
 def sample_user_id():
     """Sample user ID for testing."""
     return 'user-12345678-1234-1234-1234-123456789012'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_team_id():
     """Sample team ID for testing."""
     return 'team-a6f27724-7042-4816-94d3-a2183ef50a09'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_player_id():
     """Sample player ID for testing."""
     return 'player-b7e38835-8153-5927-a5e4-b3294fg61b1a'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_game_id():
     """Sample game ID for testing."""
     return 'game-c8f49946-9264-6a38-b6f5-c4395gh72c2b'
@@ -134,6 +252,81 @@ def sample_timestamp():
     return datetime.now(timezone.utc).isoformat()
 
 
+_BASE_USER = {
+    'SK': 'METADATA',
+    'status': 'active',
+    'GSI1SK': 'USER',
+    'GSI2PK': 'ENTITY#USER'
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _user_keys(user_id):
+    """Key attributes for a user ID, formatted once per ID: (PK, GSI1PK, GSI2SK)."""
+    return f'USER#{user_id}', f'COGNITO#{user_id}', f'METADATA#{user_id}'
+
+
+def make_user_item(user_id, timestamp, **overrides):
+    """Build a user METADATA item; keyword arguments override or add attributes."""
+    pk, gsi1pk, gsi2sk = _user_keys(user_id)
+    user = dict(
+        _BASE_USER,
+        PK=pk,
+        userId=user_id,
+        createdAt=timestamp,
+        updatedAt=timestamp,
+        GSI1PK=gsi1pk,
+        GSI2SK=gsi2sk
+    )
+    user.update(overrides)
+    return user
+
+
+@pytest.fixture(scope='session')
+def user_item_builder():
+    """Fixture that returns the user METADATA item builder function."""
+    return make_user_item
+
+
+# Authorizer subtrees shared across events, keyed by user ID.
+# Handlers only read the claims, so one dict per user is safe to reuse.
+_JWT_AUTHORIZERS = {}
+
+
+def _build_jwt_authorizer(user_id):
+    """Build the JWT authorizer context for a user ID."""
+    return {
+        'jwt': {
+            'claims': {
+                'sub': user_id,
+                'email': f'{user_id}@example.com'
+            }
+        }
+    }
+
+
+def _jwt_authorizer(user_id):
+    """Return the cached JWT authorizer context for a user ID."""
+    authorizer = _JWT_AUTHORIZERS.get(user_id)
+    if authorizer is None:
+        authorizer = _JWT_AUTHORIZERS[user_id] = _build_jwt_authorizer(user_id)
+    return authorizer
+
+
+@pytest.fixture(autouse=True)
+def _jwt_authorizers_unmodified():
+    """Fail the test that mutated a shared authorizer context."""
+    yield
+    mutated = [
+        user_id for user_id, authorizer in _JWT_AUTHORIZERS.items()
+        if authorizer != _build_jwt_authorizer(user_id)
+    ]
+    # Drop the damaged contexts so later tests get clean ones
+    for user_id in mutated:
+        del _JWT_AUTHORIZERS[user_id]
+    assert not mutated, f'Test mutated shared requestContext.authorizer for {mutated}'
+
+
 def create_api_gateway_event(
     method='GET',
     path='/',
@@ -146,6 +339,9 @@ def create_api_gateway_event(
     """
     Create a mock API Gateway event (HTTP API format 2.0).
     
+    Every call returns a fresh event; only the per-user authorizer context
+    is shared, and a test that mutates it fails in its own teardown.
+    
     Args:
         method: HTTP method
         path: Request path
@@ -158,8 +354,6 @@ def create_api_gateway_event(
     Returns:
         API Gateway event dict
     """
-    import json
-    
     event = {
         'version': '2.0',
         'routeKey': f'{method} {path}',
@@ -178,12 +372,7 @@ def create_api_gateway_event(
     
     # Add JWT claims if user_id provided
     if user_id:
-        event['requestContext']['authorizer']['jwt'] = {
-            'claims': {
-                'sub': user_id,
-                'email': f'{user_id}@example.com'
-            }
-        }
+        event['requestContext']['authorizer'] = _jwt_authorizer(user_id)
     
     # Add body
     if body is not None:
@@ -229,33 +418,79 @@ def create_cognito_event(user_id, email, attributes=None):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def api_event_builder():
     """Fixture that returns the event builder function."""
     return create_api_gateway_event
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cognito_event_builder():
     """Fixture that returns the Cognito event builder function."""
     return create_cognito_event
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def mock_context():
-    """Create a mock Lambda context object."""
-    class MockContext:
-        def __init__(self):
-            self.function_name = 'test-function'
-            self.function_version = '1'
-            self.invoked_function_arn = 'arn:aws:lambda:us-east-1:123456789012:function:test-function'
-            self.memory_limit_in_mb = 128
-            self.aws_request_id = 'test-request-id'
-            self.log_group_name = '/aws/lambda/test-function'
-            self.log_stream_name = 'test-stream'
-            
-        def get_remaining_time_in_millis(self):
-            return 30000
+    """Create a mock Lambda context object (handlers never mutate it)."""
+    return SimpleNamespace(
+        function_name='test-function',
+        function_version='1',
+        invoked_function_arn='arn:aws:lambda:us-east-1:123456789012:function:test-function',
+        memory_limit_in_mb=128,
+        aws_request_id='test-request-id',
+        log_group_name='/aws/lambda/test-function',
+        log_stream_name='test-stream',
+        get_remaining_time_in_millis=lambda: 30000
+    )
+
+
+@pytest.fixture(scope='session')
+def decode_body():
+    """Decode a handler response body (orjson when installed, else stdlib json)."""
+    return _decode_json
+
+
+@pytest.fixture
+def mock_empty_table():
+    """MagicMock table that behaves like an empty DynamoDB table for reads."""
+    table = MagicMock()
+    table.get_item.return_value = {}
+    table.query.return_value = {'Items': []}
+    return table
+
+
+@pytest.fixture
+def patch_get_table(monkeypatch, mock_empty_table):
+    """
+    Factory that patches a handler module's get_table for the current test.
     
-    return MockContext()
+    patch_get_table('src.users.get.handler', table=dynamodb_table) replaces
+    get_table with a MagicMock returning table (mock_empty_table when
+    omitted) and returns the mock; set its return_value to point the
+    handler at another table mid-test.
+    """
+    def _patch(handler_module, table=None):
+        get_table = MagicMock(return_value=mock_empty_table if table is None else table)
+        monkeypatch.setattr(f'{handler_module}.get_table', get_table)
+        return get_table
+    return _patch
+
+
+class _ErrorTable:
+    """Minimal table stub whose read operations raise a ClientError."""
+    
+    def __init__(self, code, message, operation):
+        self._error = ClientError({'Error': {'Code': code, 'Message': message}}, operation)
+    
+    def get_item(self, **kwargs):
+        raise self._error
+    
+    def query(self, **kwargs):
+        raise self._error
+
 
+@pytest.fixture(scope='session')
+def error_table_builder():
+    """Fixture that returns the error table stub class: (code, message, operation)."""
+    return _ErrorTable
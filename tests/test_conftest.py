@@ -0,0 +1,37 @@
+"""
+Unit tests for the shared fixtures in tests/conftest.py
+
+Tests cover:
+- seed_items: both the moto backend path and the BatchWriteItem fallback
+"""
+
+import pytest
+
+from tests import conftest
+
+
+class TestSeedItems:
+    """Test the seed_items fixture on each seeding path."""
+    
+    @pytest.mark.parametrize('moto_backend', [True, False], ids=['moto-backend', 'batch-write'])
+    def test_seed_items_writes_every_item(self, request, monkeypatch, dynamodb_table, moto_backend):
+        """
+        GIVEN more items than one BatchWriteItem call accepts
+        WHEN seed_items writes them on either seeding path
+        THEN every item should be readable from the mocked table
+        """
+        # Arrange - seed_items picks its path at setup, so patch before requesting it
+        monkeypatch.setattr(conftest, '_MOTO_BACKEND_SEEDING', moto_backend)
+        seed_items = request.getfixturevalue('seed_items')
+        items = [
+            {'PK': f'USER#user-{i}', 'SK': 'METADATA', 'userId': f'user-{i}', 'tags': {'a', 'b'}}
+            for i in range(conftest._BATCH_WRITE_LIMIT + 5)
+        ]
+        
+        # Act
+        seed_items(items)
+        
+        # Assert
+        for item in items:
+            response = dynamodb_table.get_item(Key={'PK': item['PK'], 'SK': 'METADATA'})
+            assert response['Item'] == item
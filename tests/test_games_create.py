@@ -2,8 +2,7 @@
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
-from botocore.exceptions import ClientError
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -14,7 +13,7 @@ def handler():
 
 
 class TestCreateGameSuccess:
-    def test_create_game_with_team_id(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_team_id, sample_timestamp):
+    def test_create_game_with_team_id(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_team_id):
         """Test creating a game for a team"""
         team = {'PK': f'TEAM#{sample_team_id}', 'SK': 'METADATA', 'teamId': sample_team_id, 'team_type': 'MANAGED', 'status': 'active'}
         membership = {'PK': f'USER#{sample_user_id}', 'SK': f'TEAM#{sample_team_id}', 'role': 'team-owner', 'status': 'active'}
@@ -30,7 +29,7 @@ class TestCreateGameSuccess:
             assert body['gameTitle'] == 'Test Game'
             assert 'gameId' in body
     
-    def test_create_game_with_default_personal_team(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
+    def test_create_game_with_default_personal_team(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id):
         """Test creating game without teamId uses Default personal team"""
         personal_team_id = 'team-personal-default'
         membership = {'PK': f'USER#{sample_user_id}', 'SK': f'TEAM#{personal_team_id}', 'teamId': personal_team_id, 'role': 'team-owner', 'status': 'active'}
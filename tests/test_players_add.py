@@ -2,8 +2,7 @@
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
-from botocore.exceptions import ClientError
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -14,7 +13,7 @@ def handler():
 
 
 class TestAddPlayerSuccess:
-    def test_add_ghost_player(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_team_id, sample_timestamp):
+    def test_add_ghost_player(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_team_id):
         """Test adding a ghost player to roster"""
         team = {'PK': f'TEAM#{sample_team_id}', 'SK': 'METADATA', 'teamId': sample_team_id, 'name': 'Test', 'ownerId': sample_user_id, 'team_type': 'MANAGED', 'status': 'active'}
         membership = {'PK': f'USER#{sample_user_id}', 'SK': f'TEAM#{sample_team_id}', 'userId': sample_user_id, 'teamId': sample_team_id, 'role': 'team-owner', 'status': 'active'}
@@ -2,8 +2,7 @@
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
-from botocore.exceptions import ClientError
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -14,6 +14,12 @@ from unittest.mock import patch, MagicMock
 from botocore.exceptions import ClientError
 
 
+_INTERNAL_ERROR_QUERY = ClientError(
+    {'Error': {'Code': 'InternalServerError', 'Message': 'Query failed'}},
+    'Query'
+)
+
+
 @pytest.fixture
 def handler():
     """Import handler with mocked dependencies."""
@@ -25,7 +31,7 @@ def handler():
 class TestUserContextSuccess:
     """Test successful user context retrieval."""
     
-    def test_user_with_personal_and_managed_teams(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
+    def test_user_with_personal_and_managed_teams(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id):
         """
         GIVEN a user with both PERSONAL and MANAGED teams
         WHEN GET /users/context is called
@@ -68,8 +74,9 @@ class TestUserContextSuccess:
                 'status': 'active'
             }
         ]
-        for item in memberships + teams:
-            dynamodb_table.put_item(Item=item)
+        with dynamodb_table.batch_writer() as batch:
+            for item in memberships + teams:
+                batch.put_item(Item=item)
         
         event = api_event_builder(
             method='GET',
@@ -194,10 +201,7 @@ class TestUserContextDynamoDBErrors:
         )
         
         mock_table = MagicMock()
-        mock_table.query.side_effect = ClientError(
-            {'Error': {'Code': 'InternalServerError', 'Message': 'Query failed'}},
-            'Query'
-        )
+        mock_table.query.side_effect = _INTERNAL_ERROR_QUERY
         
         with patch('src.users.context.handler.get_table', return_value=mock_table):
             # Act
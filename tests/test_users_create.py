@@ -15,6 +15,16 @@ from botocore.exceptions import ClientError
 from datetime import datetime, timezone
 
 
+_CONDITIONAL_FAILED = ClientError(
+    {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'Item already exists'}},
+    'PutItem'
+)
+_INTERNAL_ERROR_PUT = ClientError(
+    {'Error': {'Code': 'InternalServerError', 'Message': 'DynamoDB error'}},
+    'PutItem'
+)
+
+
 @pytest.fixture
 def handler():
     """Import handler with mocked dependencies."""
@@ -200,15 +210,7 @@ class TestCreateUserDynamoDBErrors:
         event = cognito_event_builder(user_id=user_id, email='duplicate@example.com')
         
         mock_table = MagicMock()
-        mock_table.put_item.side_effect = ClientError(
-            {
-                'Error': {
-                    'Code': 'ConditionalCheckFailedException',
-                    'Message': 'Item already exists'
-                }
-            },
-            'PutItem'
-        )
+        mock_table.put_item.side_effect = _CONDITIONAL_FAILED
         
         with patch('src.users.create.handler.get_table', return_value=mock_table):
             # Act & Assert
@@ -227,10 +229,7 @@ class TestCreateUserDynamoDBErrors:
         
         # Mock DynamoDB to raise error
         mock_table = Mock()
-        mock_table.put_item.side_effect = ClientError(
-            {'Error': {'Code': 'InternalServerError', 'Message': 'DynamoDB error'}},
-            'PutItem'
-        )
+        mock_table.put_item.side_effect = _INTERNAL_ERROR_PUT
         
         # Act - Cognito trigger returns event even on error
         with patch('src.users.create.handler.get_table', return_value=mock_table):
@@ -15,6 +15,12 @@ from unittest.mock import patch, MagicMock
 from botocore.exceptions import ClientError
 
 
+_INTERNAL_ERROR_UPDATE = ClientError(
+    {'Error': {'Code': 'InternalServerError', 'Message': 'Update failed'}},
+    'UpdateItem'
+)
+
+
 @pytest.fixture
 def handler():
     """Import handler with mocked dependencies."""
@@ -164,10 +170,7 @@ class TestDeleteUserDynamoDBErrors:
         
         mock_table = MagicMock()
         mock_table.get_item.return_value = {'Item': {'PK': f'USER#{sample_user_id}', 'SK': 'METADATA', 'status': 'active'}}
-        mock_table.update_item.side_effect = ClientError(
-            {'Error': {'Code': 'InternalServerError', 'Message': 'Update failed'}},
-            'UpdateItem'
-        )
+        mock_table.update_item.side_effect = _INTERNAL_ERROR_UPDATE
         
         with patch('src.users.delete.handler.get_table', return_value=mock_table):
             # Act
@@ -9,119 +9,81 @@ Tests cover:
 - Edge cases: Invalid user IDs
 """
 
-import json
 import pytest
-from unittest.mock import patch, MagicMock
-from botocore.exceptions import ClientError
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def handler():
-    """Import handler with mocked dependencies."""
-    with patch('src.users.get.handler.get_table'):
-        from src.users.get.handler import handler as lambda_handler
-        yield lambda_handler
+    """Import the handler once per module; get_table is patched per test."""
+    from src.users.get.handler import handler as lambda_handler
+    return lambda_handler
+
+
+@pytest.fixture(autouse=True)
+def mock_get_table(patch_get_table):
+    """Patch users/get get_table for every test; see conftest.patch_get_table."""
+    return patch_get_table('src.users.get.handler')
+
+
+@pytest.fixture(scope='module')
+def base_event(api_event_builder, sample_user_id):
+    """GET /users/{userId} event for the sample user, built once per module."""
+    return api_event_builder(
+        method='GET',
+        path=f'/users/{sample_user_id}',
+        path_parameters={'userId': sample_user_id},
+        user_id=sample_user_id
+    )
 
 
 class TestGetUserSuccess:
     """Test successful user retrieval paths."""
     
-    def test_get_user_success(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
-        """
-        GIVEN a user exists in DynamoDB
+    @pytest.mark.parametrize('overrides,expected', [
+        (
+            {'email': 'john.doe@example.com', 'firstName': 'John', 'lastName': 'Doe', 'phoneNumber': '+15555551234'},
+            {'email': 'john.doe@example.com', 'firstName': 'John', 'lastName': 'Doe', 'phoneNumber': '+15555551234'}
+        ),
+        (
+            {'email': 'minimal@example.com', 'firstName': 'Minimal', 'lastName': 'User'},
+            {'email': 'minimal@example.com', 'firstName': 'Minimal', 'lastName': 'User'}
+        ),
+        (
+            {'email': 'test@example.com', 'firstName': '', 'lastName': ''},
+            {'firstName': '', 'lastName': ''}
+        ),
+        (
+            {'email': 'deleted@example.com', 'firstName': 'Deleted', 'lastName': 'User', 'status': 'deleted'},
+            {}
+        ),
+    ], ids=['full', 'minimal', 'empty-optional', 'deleted'])
+    def test_get_user_variants(self, handler, decode_body, mock_get_table, dynamodb_table, seed_items, user_item_builder, base_event, mock_context, sample_user_id, sample_timestamp, overrides, expected):
+        """
+        GIVEN a user exists in DynamoDB (all fields, minimal fields,
+              empty optional fields, or soft-deleted)
         WHEN GET /users/{userId} is called
         THEN user data should be returned
         """
         # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'john.doe@example.com',
-            'firstName': 'John',
-            'lastName': 'Doe',
-            'phoneNumber': '+15555551234',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
+        mock_get_table.return_value = dynamodb_table
+        seed_items([user_item_builder(sample_user_id, sample_timestamp, **overrides)])
         
-        event = api_event_builder(
-            method='GET',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            user_id=sample_user_id
-        )
+        # Act
+        result = handler(base_event, mock_context)
         
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body['userId'] == sample_user_id
-            assert body['email'] == 'john.doe@example.com'
-            assert body['firstName'] == 'John'
-            assert body['lastName'] == 'Doe'
-            assert body['phoneNumber'] == '+15555551234'
-            # Note: users don't have a 'status' field
-            # GSI keys should not be in response
-    
-    def test_get_user_minimal_fields(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
-        """
-        GIVEN a user with minimal fields (no optional fields)
-        WHEN GET /users/{userId} is called
-        THEN user data should be returned with only required fields
-        """
-        # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'minimal@example.com',
-            'firstName': 'Minimal',
-            'lastName': 'User',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
-        
-        event = api_event_builder(
-            method='GET',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            user_id=sample_user_id
-        )
-        
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body['userId'] == sample_user_id
-            assert body['email'] == 'minimal@example.com'
-            assert body['firstName'] == 'Minimal'
-            assert body['lastName'] == 'User'
-            # Minimal fields test - no optional phoneNumber
+        # Assert
+        assert result['statusCode'] == 200
+        body = decode_body(result['body'])
+        expected = {'userId': sample_user_id, **expected}
+        assert {key: body.get(key) for key in expected} == expected
+        # Note: users don't have a 'status' field
+        # GSI keys should not be in response
 
 
 class TestGetUserValidation:
     """Test input validation."""
     
-    def test_missing_user_id_in_path(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_missing_user_id_in_path(self, handler, api_event_builder, mock_context):
         """
         GIVEN an API event without userId in path parameters
         WHEN the handler is invoked
@@ -135,14 +97,13 @@ class TestGetUserValidation:
             user_id='user-123'
         )
         
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 400
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 400
     
-    def test_missing_auth_user_id(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id):
+    def test_missing_auth_user_id(self, handler, api_event_builder, mock_context, sample_user_id):
         """
         GIVEN an API event without JWT authorization
         WHEN the handler is invoked
@@ -156,19 +117,18 @@ class TestGetUserValidation:
             user_id=None  # No authorization
         )
         
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            # Handler checks existence first, so returns 404 if user doesn't exist
-            assert result['statusCode'] == 404
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        # Handler checks existence first, so returns 404 if user doesn't exist
+        assert result['statusCode'] == 404
 
 
 class TestGetUserAuthorization:
     """Test authorization rules."""
     
-    def test_user_cannot_get_other_user(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_user_cannot_get_other_user(self, handler, api_event_builder, mock_context):
         """
         GIVEN user A tries to GET user B's profile
         WHEN the handler is invoked
@@ -185,18 +145,17 @@ class TestGetUserAuthorization:
             user_id=user_a  # User A trying to access User B
         )
         
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 404
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 404
 
 
 class TestGetUserNotFound:
     """Test user not found scenarios."""
     
-    def test_user_not_found(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_user_not_found(self, handler, api_event_builder, mock_context):
         """
         GIVEN a userId that doesn't exist in DynamoDB
         WHEN GET /users/{userId} is called
@@ -211,168 +170,32 @@ class TestGetUserNotFound:
             user_id=non_existent_user
         )
         
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 404
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 404
 
 
 class TestGetUserDynamoDBErrors:
     """Test DynamoDB error scenarios."""
     
-    def test_dynamodb_general_error(self, handler, api_event_builder, mock_context, sample_user_id):
-        """
-        GIVEN DynamoDB returns a general error
-        WHEN the handler tries to get a user
-        THEN it should return 500 Internal Server Error
-        """
-        # Arrange
-        event = api_event_builder(
-            method='GET',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            user_id=sample_user_id
-        )
-        
-        mock_table = MagicMock()
-        mock_table.get_item.side_effect = ClientError(
-            {
-                'Error': {
-                    'Code': 'InternalServerError',
-                    'Message': 'DynamoDB error'
-                }
-            },
-            'GetItem'
-        )
-        
-        with patch('src.users.get.handler.get_table', return_value=mock_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            # Handler requires firstName field - test data needs to match reality
-        # This test should use a valid user with all required fields
-        assert result['statusCode'] == 500
-    
-    def test_dynamodb_resource_not_found(self, handler, api_event_builder, mock_context, sample_user_id):
+    @pytest.mark.parametrize('code,message', [
+        ('InternalServerError', 'DynamoDB error'),
+        ('ResourceNotFoundException', 'Table not found'),
+    ])
+    def test_dynamodb_client_error(self, handler, mock_get_table, error_table_builder, base_event, mock_context, code, message):
         """
-        GIVEN DynamoDB table does not exist
+        GIVEN DynamoDB returns an error (general failure or missing table)
         WHEN the handler tries to get a user
         THEN it should return 500 Internal Server Error
         """
         # Arrange
-        event = api_event_builder(
-            method='GET',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            user_id=sample_user_id
-        )
+        error_table = error_table_builder(code, message, 'GetItem')
+        mock_get_table.return_value = error_table
         
-        mock_table = MagicMock()
-        mock_table.get_item.side_effect = ClientError(
-            {
-                'Error': {
-                    'Code': 'ResourceNotFoundException',
-                    'Message': 'Table not found'
-                }
-            },
-            'GetItem'
-        )
+        # Act
+        result = handler(base_event, mock_context)
         
-        with patch('src.users.get.handler.get_table', return_value=mock_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            # Handler requires firstName field - test data needs to match reality
-        # This test should use a valid user with all required fields
+        # Assert
         assert result['statusCode'] == 500
-
-
-class TestGetUserEdgeCases:
-    """Test edge cases and boundary conditions."""
-    
-    def test_get_user_with_empty_optional_fields(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
-        """
-        GIVEN a user with empty string optional fields
-        WHEN GET /users/{userId} is called
-        THEN empty fields should be handled correctly
-        """
-        # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'test@example.com',
-            'firstName': '',
-            'lastName': '',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
-        
-        event = api_event_builder(
-            method='GET',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            user_id=sample_user_id
-        )
-        
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body['firstName'] == ''
-            assert body['lastName'] == ''
-    
-    def test_get_deleted_user(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
-        """
-        GIVEN a user with status 'deleted'
-        WHEN GET /users/{userId} is called
-        THEN it should still return the user (soft delete)
-        """
-        # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'deleted@example.com',
-            'firstName': 'Deleted',
-            'lastName': 'User',
-            'status': 'deleted',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
-        
-        event = api_event_builder(
-            method='GET',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            user_id=sample_user_id
-        )
-        
-        with patch('src.users.get.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            # Note: handler doesn't return 'status' field
-            # Users don't have status field in normal schema
-
@@ -8,33 +8,47 @@ Tests cover:
 - Edge cases: Empty results, pagination
 """
 
-import json
 import pytest
-from unittest.mock import patch, MagicMock
-from botocore.exceptions import ClientError
+from boto3.dynamodb.conditions import Key
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def handler():
-    """Import handler with mocked dependencies."""
-    with patch('src.users.query.handler.get_table'):
-        from src.users.query.handler import handler as lambda_handler
-        yield lambda_handler
+    """Import the handler once per module; get_table is patched per test."""
+    from src.users.query.handler import handler as lambda_handler
+    return lambda_handler
+
+
+@pytest.fixture(autouse=True)
+def mock_get_table(patch_get_table):
+    """Patch users/query get_table for every test; see conftest.patch_get_table."""
+    return patch_get_table('src.users.query.handler')
+
+
+@pytest.fixture(scope='module')
+def base_event(api_event_builder):
+    """GET /users event as an authenticated user, built once per module."""
+    return api_event_builder(
+        method='GET',
+        path='/users',
+        user_id='admin-user'
+    )
 
 
 class TestQueryUsersSuccess:
     """Test successful user query paths."""
     
-    def test_query_all_users(self, handler, dynamodb_table, api_event_builder, mock_context, sample_timestamp):
+    def test_query_all_users(self, handler, decode_body, mock_get_table, dynamodb_table, seed_items, base_event, mock_context, sample_timestamp):
         """
         GIVEN multiple users in DynamoDB
         WHEN GET /users is called
         THEN all users should be returned
         """
         # Arrange - Create test users
+        mock_get_table.return_value = dynamodb_table
         users = [
             {
-                'PK': f'USER#user-1',
+                'PK': 'USER#user-1',
                 'SK': 'METADATA',
                 'userId': 'user-1',
                 'email': 'user1@example.com',
@@ -47,7 +61,7 @@ class TestQueryUsersSuccess:
                 'GSI2SK': 'METADATA#user-1'
             },
             {
-                'PK': f'USER#user-2',
+                'PK': 'USER#user-2',
                 'SK': 'METADATA',
                 'userId': 'user-2',
                 'email': 'user2@example.com',
@@ -60,127 +74,96 @@ class TestQueryUsersSuccess:
                 'GSI2SK': 'METADATA#user-2'
             }
         ]
-        for user in users:
-            dynamodb_table.put_item(Item=user)
+        seed_items(users)
         
-        event = api_event_builder(
-            method='GET',
-            path='/users',
-            user_id='admin-user'
-        )
+        # Act
+        result = handler(base_event, mock_context)
         
-        with patch('src.users.query.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert 'users' in body
-            assert len(body['users']) >= 2
+        # Assert
+        assert result['statusCode'] == 200
+        body = decode_body(result['body'])
+        assert 'users' in body
+        assert len(body['users']) >= 2
     
-    def test_query_users_with_limit(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_query_users_with_limit(self, handler, mock_empty_table, base_event, mock_context):
         """
         GIVEN query parameter limit=10
         WHEN GET /users?limit=10 is called
-        THEN at most 10 users should be returned
+        THEN the user listing query should be limited to 10 items
         """
         # Arrange
-        event = api_event_builder(
-            method='GET',
-            path='/users',
-            query_string_parameters={'limit': '10'},
-            user_id='admin-user'
-        )
+        event = {**base_event, 'queryStringParameters': {'limit': '10'}}
         
-        with patch('src.users.query.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert len(body['users']) <= 10
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 200
+        query_kwargs = mock_empty_table.query.call_args.kwargs
+        assert query_kwargs['IndexName'] == 'GSI2'
+        assert query_kwargs['KeyConditionExpression'] == Key('GSI2PK').eq('ENTITY#USER')
+        assert query_kwargs['Limit'] == 10
 
 
 class TestQueryUsersValidation:
     """Test input validation."""
     
-    def test_invalid_limit_parameter(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_invalid_limit_parameter(self, handler, base_event, mock_context):
         """
         GIVEN an invalid limit parameter
         WHEN GET /users is called
         THEN it should return 400
         """
         # Arrange
-        event = api_event_builder(
-            method='GET',
-            path='/users',
-            query_string_parameters={'limit': 'invalid'},
-            user_id='admin-user'
-        )
+        event = {**base_event, 'queryStringParameters': {'limit': 'invalid'}}
+        
+        # Act
+        result = handler(event, mock_context)
         
-        with patch('src.users.query.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            # Handler processes invalid limit and returns 500 on ValueError
+        # Assert
+        # Handler processes invalid limit and returns 500 on ValueError
         assert result['statusCode'] == 500
 
 
 class TestQueryUsersDynamoDBErrors:
     """Test DynamoDB error scenarios."""
     
-    def test_dynamodb_query_error(self, handler, api_event_builder, mock_context):
+    def test_dynamodb_query_error(self, handler, mock_get_table, error_table_builder, base_event, mock_context):
         """
         GIVEN DynamoDB returns an error
         WHEN GET /users is called
         THEN it should return 500
         """
         # Arrange
-        event = api_event_builder(
-            method='GET',
-            path='/users',
-            user_id='admin-user'
-        )
+        error_table = error_table_builder('InternalServerError', 'Query failed', 'Query')
+        mock_get_table.return_value = error_table
         
-        mock_table = MagicMock()
-        mock_table.query.side_effect = ClientError(
-            {'Error': {'Code': 'InternalServerError', 'Message': 'Query failed'}},
-            'Query'
-        )
+        # Act
+        result = handler(base_event, mock_context)
         
-        with patch('src.users.query.handler.get_table', return_value=mock_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 500
+        # Assert
+        assert result['statusCode'] == 500
 
 
 class TestQueryUsersEdgeCases:
     """Test edge cases."""
     
-    def test_query_users_empty_result(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_query_users_empty_result(self, handler, decode_body, mock_empty_table, base_event, mock_context):
         """
         GIVEN no users in DynamoDB
         WHEN GET /users is called
-        THEN empty array should be returned
+        THEN the default user listing query should run and return an empty array
         """
-        # Arrange
-        event = api_event_builder(
-            method='GET',
-            path='/users',
-            user_id='admin-user'
-        )
+        # Act
+        result = handler(base_event, mock_context)
         
-        with patch('src.users.query.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body['users'] == []
+        # Assert
+        assert result['statusCode'] == 200
+        body = decode_body(result['body'])
+        assert body['users'] == []
+        query_kwargs = mock_empty_table.query.call_args.kwargs
+        assert query_kwargs['IndexName'] == 'GSI2'
+        assert query_kwargs['KeyConditionExpression'] == Key('GSI2PK').eq('ENTITY#USER')
+        assert query_kwargs['Limit'] == 50
+        assert 'ExclusiveStartKey' not in query_kwargs
 
@@ -9,47 +9,82 @@ Tests cover:
 - Edge cases: Partial updates, empty fields
 """
 
-import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from botocore.exceptions import ClientError
 
 
+_INTERNAL_ERROR_UPDATE = ClientError(
+    {'Error': {'Code': 'InternalServerError', 'Message': 'Update failed'}},
+    'UpdateItem'
+)
+
+
+def _apply_update_expression(item, update_kwargs):
+    """
+    Apply an update_item call's `SET #a = :a, ...` expression to a copy of item.
+    
+    Covers only the plain SET assignments the update handler builds.
+    """
+    updated = dict(item)
+    names = update_kwargs.get('ExpressionAttributeNames', {})
+    values = update_kwargs['ExpressionAttributeValues']
+    for assignment in update_kwargs['UpdateExpression'].removeprefix('SET ').split(', '):
+        name, value = assignment.split(' = ')
+        updated[names.get(name, name)] = values[value]
+    return updated
+
+
 @pytest.fixture
+def mock_user_table():
+    """
+    Factory for a MagicMock table holding a single user item.
+    
+    get_item returns the item and update_item returns the item with the
+    update applied, so handler logic is tested without going through moto.
+    """
+    def _build(user_item):
+        table = MagicMock()
+        table.get_item.return_value = {'Item': user_item}
+        table.update_item.side_effect = lambda **kwargs: {
+            'Attributes': _apply_update_expression(user_item, kwargs)
+        }
+        return table
+    return _build
+
+
+@pytest.fixture(scope='module')
 def handler():
-    """Import handler with mocked dependencies."""
-    with patch('src.users.update.handler.get_table'):
-        from src.users.update.handler import handler as lambda_handler
-        yield lambda_handler
+    """Import the handler once per module; get_table is patched per test."""
+    from src.users.update.handler import handler as lambda_handler
+    return lambda_handler
+
+
+@pytest.fixture(autouse=True)
+def mock_get_table(patch_get_table):
+    """Patch users/update get_table for every test; see conftest.patch_get_table."""
+    return patch_get_table('src.users.update.handler')
 
 
 class TestUpdateUserSuccess:
     """Test successful user update paths."""
     
-    def test_update_user_all_fields(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
+    def test_update_user_all_fields(self, handler, decode_body, mock_get_table, dynamodb_table, seed_items, user_item_builder, api_event_builder, mock_context, sample_user_id, sample_timestamp):
         """
         GIVEN a valid update request with all updatable fields
         WHEN PUT /users/{userId} is called
         THEN user should be updated with new values
         """
         # Arrange - Create existing user
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'old@example.com',
-            'firstName': 'Old',
-            'lastName': 'Name',
-            'phoneNumber': '+15555550000',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
+        mock_get_table.return_value = dynamodb_table
+        seed_items([user_item_builder(
+            sample_user_id,
+            sample_timestamp,
+            email='old@example.com',
+            firstName='Old',
+            lastName='Name',
+            phoneNumber='+15555550000'
+        )])
         
         event = api_event_builder(
             method='PUT',
@@ -63,42 +98,32 @@ class TestUpdateUserSuccess:
             user_id=sample_user_id
         )
         
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body['firstName'] == 'New'
-            assert body['lastName'] == 'Updated'
-            assert body['phoneNumber'] == '+15555559999'
-            assert 'updatedAt' in body
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 200
+        body = decode_body(result['body'])
+        assert body['firstName'] == 'New'
+        assert body['lastName'] == 'Updated'
+        assert body['phoneNumber'] == '+15555559999'
+        assert 'updatedAt' in body
     
-    def test_update_user_partial_fields(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
+    def test_update_user_partial_fields(self, handler, decode_body, mock_get_table, mock_user_table, user_item_builder, api_event_builder, mock_context, sample_user_id, sample_timestamp):
         """
         GIVEN an update request with only some fields
         WHEN PUT /users/{userId} is called
         THEN only specified fields should be updated
         """
         # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'test@example.com',
-            'firstName': 'John',
-            'lastName': 'Doe',
-            'phoneNumber': '+15555551234',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
+        mock_table = mock_user_table(user_item_builder(
+            sample_user_id,
+            sample_timestamp,
+            email='test@example.com',
+            firstName='John',
+            lastName='Doe',
+            phoneNumber='+15555551234'
+        ))
         
         event = api_event_builder(
             method='PUT',
@@ -108,162 +133,57 @@ class TestUpdateUserSuccess:
             user_id=sample_user_id
         )
         
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body['firstName'] == 'Jane'
-            assert body['lastName'] == 'Doe'  # Unchanged
-            assert body['phoneNumber'] == '+15555551234'  # Unchanged
-
-
-class TestUpdateUserValidation:
-    """Test input validation."""
-    
-    def test_update_readonly_field_userId(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
-        """
-        GIVEN an update request trying to change userId
-        WHEN PUT /users/{userId} is called
-        THEN it should return 400 (readonly field)
-        """
-        # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'test@example.com',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
+        mock_get_table.return_value = mock_table
         
-        event = api_event_builder(
-            method='PUT',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            body={'userId': 'different-user-id'},
-            user_id=sample_user_id
-        )
+        # Act
+        result = handler(event, mock_context)
         
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 400
-            body = json.loads(result['body'])
-            assert 'error' in body
-    
-    def test_missing_user_id_in_path(self, handler, dynamodb_table, api_event_builder, mock_context):
-        """
-        GIVEN an update request without userId in path
-        WHEN the handler is invoked
-        THEN it should return 400
-        """
-        # Arrange
-        event = api_event_builder(
-            method='PUT',
-            path='/users/',
-            path_parameters={},
-            body={'firstName': 'Test'},
-            user_id='user-123'
-        )
-        
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 400
-    
-    def test_empty_request_body(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id):
-        """
-        GIVEN an update request with empty body
-        WHEN PUT /users/{userId} is called
-        THEN it should return 400
-        """
-        # Arrange
-        event = api_event_builder(
-            method='PUT',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            body={},
-            user_id=sample_user_id
-        )
-        
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 400
-            body = json.loads(result['body'])
-            assert 'error' in body
-    
-    def test_malformed_json_body(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id):
-        """
-        GIVEN an update request with malformed JSON
-        WHEN the handler is invoked
-        THEN it should return 400
-        """
-        # Arrange
-        event = api_event_builder(
-            method='PUT',
-            path=f'/users/{sample_user_id}',
-            path_parameters={'userId': sample_user_id},
-            body='{"invalid": json}',  # Malformed JSON
-            user_id=sample_user_id
-        )
-        
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 400
+        # Assert
+        assert result['statusCode'] == 200
+        body = decode_body(result['body'])
+        assert body['firstName'] == 'Jane'
+        assert body['lastName'] == 'Doe'  # Unchanged
+        assert body['phoneNumber'] == '+15555551234'  # Unchanged
 
 
-class TestUpdateUserAuthorization:
-    """Test authorization rules."""
+class TestUpdateUserValidation:
+    """Test input validation and authorization rules."""
     
-    def test_user_cannot_update_other_user(self, handler, dynamodb_table, api_event_builder, mock_context):
+    @pytest.mark.parametrize('body,path_user_id,auth_user_id,expected_status', [
+        ({'userId': 'different-user-id'}, 'user-123', 'user-123', 400),
+        ({'firstName': 'Test'}, None, 'user-123', 400),
+        ({}, 'user-123', 'user-123', 400),
+        ('{"invalid": json}', 'user-123', 'user-123', 400),
+        # Handler checks existence first, so another user's profile is 404
+        ({'firstName': 'Hacker'}, 'user-bbb', 'user-aaa', 404),
+    ], ids=['readonly-userId', 'missing-path-userId', 'empty-body', 'malformed-json', 'other-user'])
+    def test_validation_returns_4xx(self, handler, decode_body, api_event_builder, mock_context, body, path_user_id, auth_user_id, expected_status):
         """
-        GIVEN user A tries to update user B's profile
+        GIVEN an update request that is invalid or targets another user
         WHEN PUT /users/{userId} is called
-        THEN it should return 403
+        THEN it should return the matching 4xx error
         """
         # Arrange
-        user_a = 'user-aaa'
-        user_b = 'user-bbb'
-        
         event = api_event_builder(
             method='PUT',
-            path=f'/users/{user_b}',
-            path_parameters={'userId': user_b},
-            body={'firstName': 'Hacker'},
-            user_id=user_a  # User A trying to update User B
+            path=f'/users/{path_user_id or ""}',
+            path_parameters={'userId': path_user_id} if path_user_id else {},
+            body=body,
+            user_id=auth_user_id
         )
         
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert - Handler checks existence first, so returns 404 if user doesn't exist
-            assert result['statusCode'] == 404
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == expected_status
+        assert 'error' in decode_body(result['body'])
 
 
 class TestUpdateUserNotFound:
     """Test user not found scenarios."""
     
-    def test_update_non_existent_user(self, handler, dynamodb_table, api_event_builder, mock_context):
+    def test_update_non_existent_user(self, handler, api_event_builder, mock_context):
         """
         GIVEN a userId that doesn't exist
         WHEN PUT /users/{userId} is called
@@ -279,18 +199,17 @@ class TestUpdateUserNotFound:
             user_id=non_existent_user
         )
         
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 404
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 404
 
 
 class TestUpdateUserDynamoDBErrors:
     """Test DynamoDB error scenarios."""
     
-    def test_dynamodb_update_error(self, handler, api_event_builder, mock_context, sample_user_id):
+    def test_dynamodb_update_error(self, handler, mock_get_table, api_event_builder, mock_context, sample_user_id):
         """
         GIVEN DynamoDB returns an error during update
         WHEN the handler tries to update
@@ -307,46 +226,35 @@ class TestUpdateUserDynamoDBErrors:
         
         mock_table = MagicMock()
         mock_table.get_item.return_value = {'Item': {'PK': f'USER#{sample_user_id}', 'SK': 'METADATA'}}
-        mock_table.update_item.side_effect = ClientError(
-            {'Error': {'Code': 'InternalServerError', 'Message': 'Update failed'}},
-            'UpdateItem'
-        )
+        mock_table.update_item.side_effect = _INTERNAL_ERROR_UPDATE
+        
+        mock_get_table.return_value = mock_table
         
-        with patch('src.users.update.handler.get_table', return_value=mock_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 500
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 500
 
 
 class TestUpdateUserEdgeCases:
     """Test edge cases."""
     
-    def test_update_removes_optional_field(self, handler, dynamodb_table, api_event_builder, mock_context, sample_user_id, sample_timestamp):
+    def test_update_removes_optional_field(self, handler, decode_body, mock_get_table, mock_user_table, user_item_builder, api_event_builder, mock_context, sample_user_id, sample_timestamp):
         """
         GIVEN a user with optional fields
         WHEN an update sets an optional field to null/empty
         THEN the field should be removed or set to null
         """
         # Arrange
-        user_item = {
-            'PK': f'USER#{sample_user_id}',
-            'SK': 'METADATA',
-            'userId': sample_user_id,
-            'email': 'test@example.com',
-            'firstName': 'John',
-            'lastName': 'Doe',
-            'phoneNumber': '+15555551234',
-            'status': 'active',
-            'createdAt': sample_timestamp,
-            'updatedAt': sample_timestamp,
-            'GSI1PK': f'COGNITO#{sample_user_id}',
-            'GSI1SK': 'USER',
-            'GSI2PK': 'ENTITY#USER',
-            'GSI2SK': f'METADATA#{sample_user_id}'
-        }
-        dynamodb_table.put_item(Item=user_item)
+        mock_table = mock_user_table(user_item_builder(
+            sample_user_id,
+            sample_timestamp,
+            email='test@example.com',
+            firstName='John',
+            lastName='Doe',
+            phoneNumber='+15555551234'
+        ))
         
         event = api_event_builder(
             method='PUT',
@@ -356,12 +264,13 @@ class TestUpdateUserEdgeCases:
             user_id=sample_user_id
         )
         
-        with patch('src.users.update.handler.get_table', return_value=dynamodb_table):
-            # Act
-            result = handler(event, mock_context)
-            
-            # Assert
-            assert result['statusCode'] == 200
-            body = json.loads(result['body'])
-            assert body.get('phoneNumber') is None or 'phoneNumber' not in body
+        mock_get_table.return_value = mock_table
+        
+        # Act
+        result = handler(event, mock_context)
+        
+        # Assert
+        assert result['statusCode'] == 200
+        body = decode_body(result['body'])
+        assert body.get('phoneNumber') is None or 'phoneNumber' not in body
 
@@ -4,30 +4,79 @@ Unit tests for src/utils/personal_team.py
 Tests the personal team creation utility functions.
 """
 
+import itertools
+import uuid
 import pytest
-from unittest.mock import Mock, MagicMock
-from datetime import datetime, timezone
+from types import SimpleNamespace
 from botocore.exceptions import ClientError
 
+from src.utils import personal_team
 from src.utils.personal_team import create_personal_team
 
+SAMPLE_TIMESTAMP = '2024-01-01T00:00:00+00:00'
 
-@pytest.fixture
+_TRANSACTION_ERRORS = {
+    code: ClientError({'Error': {'Code': code, 'Message': 'DynamoDB error'}}, 'TransactWriteItems')
+    for code in (
+        'TransactionCanceledException',
+        'InternalServerError',
+        'ProvisionedThroughputExceededException'
+    )
+}
+
+
+class _StubClient:
+    """Minimal DynamoDB client stub that records transact_write_items calls"""
+    __slots__ = ('calls', 'error')
+    
+    def __init__(self):
+        self.calls = []
+        self.error = None
+    
+    def transact_write_items(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return {}
+
+
+class _StubTable:
+    """Minimal table stub exposing only name and meta.client"""
+    __slots__ = ('name', 'meta')
+    
+    def __init__(self, name):
+        self.name = name
+        self.meta = SimpleNamespace(client=_StubClient())
+
+
+@pytest.fixture(scope='module')
 def mock_table():
-    """Mock DynamoDB table"""
-    table = Mock()
-    table.name = 'HackTracker-test'
-    table.meta = Mock()
-    table.meta.client = Mock()
-    return table
+    """Stub DynamoDB table, shared by every test in the module"""
+    return _StubTable('HackTracker-test')
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mock_table(mock_table):
+    """Clear recorded calls and injected errors between tests"""
+    mock_table.meta.client.calls.clear()
+    mock_table.meta.client.error = None
+
+
+@pytest.fixture(scope='session')
 def sample_timestamp():
-    """Sample timestamp"""
-    return datetime.now(timezone.utc).isoformat()
+    """Sample timestamp (fixed; never compared against the wall clock)"""
+    return SAMPLE_TIMESTAMP
 
 
+@pytest.fixture
+def patch_uuid(monkeypatch):
+    """Give personal_team a deterministic uuid4 counter (unique, no os.urandom)"""
+    counter = itertools.count(1)
+    # Rebind the module's own uuid name; patching uuid.uuid4 would leak to every caller
+    monkeypatch.setattr(personal_team, 'uuid', SimpleNamespace(uuid4=lambda: uuid.UUID(int=next(counter))))
+
+
+@pytest.mark.usefixtures('patch_uuid')
 class TestCreatePersonalTeam:
     """Test create_personal_team function"""
     
@@ -36,7 +85,6 @@ class TestCreatePersonalTeam:
         # Arrange
         user_id = 'user-123'
         first_name = 'John'
-        mock_table.meta.client.transact_write_items.return_value = {}
         
         # Act
         team_id, player_id = create_personal_team(mock_table, user_id, first_name, sample_timestamp)
@@ -48,8 +96,8 @@ class TestCreatePersonalTeam:
         assert isinstance(player_id, str)
         
         # Verify transaction was called with correct structure
-        mock_table.meta.client.transact_write_items.assert_called_once()
-        call_args = mock_table.meta.client.transact_write_items.call_args[1]
+        assert len(mock_table.meta.client.calls) == 1
+        call_args = mock_table.meta.client.calls[0]
         assert 'TransactItems' in call_args
         assert len(call_args['TransactItems']) == 3
         
@@ -70,32 +118,13 @@ class TestCreatePersonalTeam:
         assert player_put['Item']['userId'] == user_id
         assert player_put['Item']['isGhost'] is False
     
-    def test_create_personal_team_transaction_cancelled(self, mock_table, sample_timestamp):
-        """Test personal team creation when transaction is cancelled"""
+    @pytest.mark.parametrize('error_code', list(_TRANSACTION_ERRORS))
+    def test_create_personal_team_client_error(self, mock_table, sample_timestamp, error_code):
+        """Test personal team creation when the transaction raises a ClientError"""
         # Arrange
         user_id = 'user-456'
         first_name = 'Jane'
-        mock_table.meta.client.transact_write_items.side_effect = ClientError(
-            {'Error': {'Code': 'TransactionCanceledException', 'Message': 'Transaction cancelled'}},
-            'TransactWriteItems'
-        )
-        
-        # Act
-        team_id, player_id = create_personal_team(mock_table, user_id, first_name, sample_timestamp)
-        
-        # Assert
-        assert team_id is None
-        assert player_id is None
-    
-    def test_create_personal_team_dynamodb_error(self, mock_table, sample_timestamp):
-        """Test personal team creation with general DynamoDB error"""
-        # Arrange
-        user_id = 'user-789'
-        first_name = 'Bob'
-        mock_table.meta.client.transact_write_items.side_effect = ClientError(
-            {'Error': {'Code': 'InternalServerError', 'Message': 'DynamoDB error'}},
-            'TransactWriteItems'
-        )
+        mock_table.meta.client.error = _TRANSACTION_ERRORS[error_code]
         
         # Act
         team_id, player_id = create_personal_team(mock_table, user_id, first_name, sample_timestamp)
@@ -109,7 +138,6 @@ class TestCreatePersonalTeam:
         # Arrange
         user_id = 'user-unique'
         first_name = 'Alice'
-        mock_table.meta.client.transact_write_items.return_value = {}
         
         # Act
         team_id, player_id = create_personal_team(mock_table, user_id, first_name, sample_timestamp)
@@ -122,7 +150,6 @@ class TestCreatePersonalTeam:
         # Arrange
         user_id = 'user-special'
         first_name = "O'Brien"
-        mock_table.meta.client.transact_write_items.return_value = {}
         
         # Act
         team_id, player_id = create_personal_team(mock_table, user_id, first_name, sample_timestamp)
@@ -132,7 +159,7 @@ class TestCreatePersonalTeam:
         assert player_id is not None
         
         # Verify player has the special character name
-        call_args = mock_table.meta.client.transact_write_items.call_args[1]
+        call_args = mock_table.meta.client.calls[0]
         player_put = call_args['TransactItems'][2]['Put']
         assert player_put['Item']['firstName'] == first_name
 
@@ -4,7 +4,10 @@ Unit tests for src/utils/validation.py
 Tests all validation utility functions comprehensively.
 """
 
+import re
+import string
 import pytest
+from hypothesis import assume, given, strategies as st
 from src.utils.validation import (
     validate_team_name,
     validate_team_description,
@@ -12,396 +15,381 @@ from src.utils.validation import (
     validate_player_number,
     validate_player_status,
     validate_player_positions,
-    validate_game_title,
     validate_game_status,
     validate_score,
     validate_team_type,
     validate_lineup
 )
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_RE_MIN_3_CHARS = re.compile("at least 3 characters")
+_RE_MAX_30_CHARS = re.compile("must not exceed 30 characters")
+_RE_MAX_50_CHARS = re.compile("must not exceed 50 characters")
+_RE_MAX_500_CHARS = re.compile("must not exceed 500 characters")
+_RE_TEAM_NAME_CHARS = re.compile("can only contain letters, numbers, and spaces")
+_RE_TEAM_NAME_REQUIRED = re.compile("Team name is required")
+_RE_TEAM_TYPE_REQUIRED = re.compile("Team type is required")
+_RE_NOT_STRING = re.compile("must be a string")
+_RE_NON_EMPTY_STRING = re.compile("must be a non-empty string")
+_RE_EMPTY = re.compile("must not be empty")
+_RE_SINGLE_WORD = re.compile("must be a single word")
+_RE_PLAYER_NAME_CHARS = re.compile("must contain only")
+_RE_FIRST_NAME = re.compile("firstName")
+_RE_NOT_INTEGER = re.compile("must be a valid integer")
+_RE_PLAYER_NUMBER_RANGE = re.compile("must be between 0 and 99")
+_RE_NEGATIVE = re.compile("must be 0 or greater")
+_RE_NOT_ONE_OF = re.compile("must be one of")
+_RE_MAX_2_POSITIONS = re.compile("maximum of 2 positions")
+_RE_INVALID_POSITION = re.compile("Invalid position")
+_RE_NOT_ARRAY = re.compile("must be an array")
+_RE_NOT_LIST = re.compile("must be a list")
+_RE_MISSING_PLAYER_ID = re.compile("missing 'playerId'")
+_RE_DUPLICATE_BATTING_ORDER = re.compile("Duplicate batting order")
+_RE_BELOW_ONE = re.compile("must be 1 or greater")
+
+# Inputs one character over each validator's length limit
+_A31 = "A" * 31
+_A51 = "A" * 51
+_A501 = "A" * 501
+
+# Hypothesis strategies for generated names
+_TEAM_NAME_WORDS = st.lists(
+    st.text(alphabet=string.ascii_letters + string.digits, min_size=1, max_size=12),
+    min_size=1,
+    max_size=4
+)
+_PLAYER_NAME = st.text(alphabet=string.ascii_letters + "'.-éñü", min_size=1, max_size=30)
+
 
 class TestValidateTeamName:
     """Test validate_team_name function"""
     
-    def test_valid_team_name(self):
-        """Test valid team name"""
-        assert validate_team_name("Warriors") == "Warriors"
-        assert validate_team_name("Team 123") == "Team 123"
-        assert validate_team_name("The Best Team") == "The Best Team"
-    
-    def test_team_name_trims_whitespace(self):
-        """Test that whitespace is trimmed"""
-        assert validate_team_name("  Warriors  ") == "Warriors"
-        assert validate_team_name("\tTeam\n") == "Team"
-    
-    def test_team_name_collapses_spaces(self):
-        """Test that multiple spaces are collapsed"""
-        assert validate_team_name("The    Best    Team") == "The Best Team"
-    
-    def test_team_name_too_short(self):
-        """Test team name too short"""
-        with pytest.raises(ValueError, match="at least 3 characters"):
-            validate_team_name("AB")
-    
-    def test_team_name_too_long(self):
-        """Test team name too long"""
-        with pytest.raises(ValueError, match="must not exceed 50 characters"):
-            validate_team_name("A" * 51)
-    
-    def test_team_name_invalid_characters(self):
-        """Test team name with invalid characters"""
-        with pytest.raises(ValueError, match="can only contain letters, numbers, and spaces"):
-            validate_team_name("Team@123")
+    @pytest.mark.parametrize('raw,expected', [
+        ("Warriors", "Warriors"),
+        ("Team 123", "Team 123"),
+        ("The Best Team", "The Best Team"),
+        # Whitespace is trimmed and runs of spaces collapsed
+        ("  Warriors  ", "Warriors"),
+        ("\tTeam\n", "Team"),
+        ("The    Best    Team", "The Best Team"),
+    ])
+    def test_valid_team_name(self, raw, expected):
+        """Test valid team names are cleaned"""
+        assert validate_team_name(raw) == expected
+    
+    @pytest.mark.parametrize('raw,match', [
+        ("AB", _RE_MIN_3_CHARS),
+        (_A51, _RE_MAX_50_CHARS),
+        ("Team@123", _RE_TEAM_NAME_CHARS),
+        ("Team-Name", _RE_TEAM_NAME_CHARS),
+        ("Team_Name", _RE_TEAM_NAME_CHARS),
+        ("", _RE_TEAM_NAME_REQUIRED),
+        (None, _RE_TEAM_NAME_REQUIRED),
+        (123, _RE_NOT_STRING),
+    ])
+    def test_invalid_team_name(self, raw, match):
+        """Test invalid team names are rejected"""
+        with pytest.raises(ValueError, match=match):
+            validate_team_name(raw)
+    
+    @given(words=_TEAM_NAME_WORDS, pad=st.sampled_from(("", " ", " \t\n")))
+    def test_team_name_normalizes_whitespace(self, words, pad):
+        """Test any alphanumeric name is trimmed and space-collapsed"""
+        expected = " ".join(words)
+        assume(3 <= len(expected) <= 50)
+        assert validate_team_name(pad + "   ".join(words) + pad) == expected
+    
+    @given(st.text(max_size=60).filter(
+        lambda s: any(not (c.isascii() and c.isalnum()) and not c.isspace() for c in s)
+    ))
+    def test_team_name_rejects_other_characters(self, raw):
+        """Test any name with a character outside letters, digits and spaces is rejected"""
         with pytest.raises(ValueError):
-            validate_team_name("Team-Name")
-        with pytest.raises(ValueError):
-            validate_team_name("Team_Name")
-    
-    def test_team_name_empty_or_none(self):
-        """Test empty or None team name"""
-        with pytest.raises(ValueError, match="Team name is required"):
-            validate_team_name("")
-        with pytest.raises(ValueError, match="Team name is required"):
-            validate_team_name(None)
-    
-    def test_team_name_not_string(self):
-        """Test team name that's not a string"""
-        with pytest.raises(ValueError, match="must be a string"):
-            validate_team_name(123)
+            validate_team_name(raw)
 
 
 class TestValidateTeamDescription:
     """Test validate_team_description function"""
     
-    def test_valid_description(self):
-        """Test valid description"""
-        assert validate_team_description("A great team") == "A great team"
-    
-    def test_description_trims_whitespace(self):
-        """Test description trims whitespace"""
-        assert validate_team_description("  Description  ") == "Description"
-    
-    def test_description_empty_returns_none(self):
-        """Test empty description returns None"""
-        assert validate_team_description("") is None
-        assert validate_team_description("   ") is None
-        assert validate_team_description(None) is None
-    
-    def test_description_too_long(self):
-        """Test description too long"""
-        with pytest.raises(ValueError, match="must not exceed 500 characters"):
-            validate_team_description("A" * 501)
-    
-    def test_description_not_string(self):
-        """Test description that's not a string"""
-        with pytest.raises(ValueError, match="must be a string"):
-            validate_team_description(123)
+    @pytest.mark.parametrize('raw,expected', [
+        ("A great team", "A great team"),
+        ("  Description  ", "Description"),
+        # Empty descriptions are treated as absent
+        ("", None),
+        ("   ", None),
+        (None, None),
+    ])
+    def test_valid_description(self, raw, expected):
+        """Test valid descriptions are cleaned"""
+        assert validate_team_description(raw) == expected
+    
+    @pytest.mark.parametrize('raw,match', [
+        (_A501, _RE_MAX_500_CHARS),
+        (123, _RE_NOT_STRING),
+    ])
+    def test_invalid_description(self, raw, match):
+        """Test invalid descriptions are rejected"""
+        with pytest.raises(ValueError, match=match):
+            validate_team_description(raw)
 
 
 class TestValidatePlayerName:
     """Test validate_player_name function"""
     
-    def test_valid_player_names(self):
-        """Test valid player names"""
-        assert validate_player_name("Smith") == "Smith"
-        assert validate_player_name("O'Malley") == "O'Malley"
-        assert validate_player_name("Smith-Jones") == "Smith-Jones"
-        assert validate_player_name("J.R.") == "J.R."
-        assert validate_player_name("José") == "José"
-    
-    def test_player_name_trims_whitespace(self):
-        """Test player name trims whitespace"""
-        assert validate_player_name("  Smith  ") == "Smith"
-    
-    def test_player_name_with_spaces(self):
-        """Test player name with spaces (should fail)"""
-        with pytest.raises(ValueError, match="must be a single word"):
-            validate_player_name("John Smith")
-    
-    def test_player_name_too_long(self):
-        """Test player name too long"""
-        with pytest.raises(ValueError, match="must not exceed 30 characters"):
-            validate_player_name("A" * 31)
-    
-    def test_player_name_empty(self):
-        """Test empty player name"""
-        with pytest.raises(ValueError, match="must be a non-empty string"):
-            validate_player_name("")
-        with pytest.raises(ValueError):
-            validate_player_name("   ")
-    
-    def test_player_name_invalid_characters(self):
-        """Test player name with invalid characters"""
-        with pytest.raises(ValueError, match="must contain only"):
-            validate_player_name("Smith@123")
+    @pytest.mark.parametrize('raw,expected', [
+        ("Smith", "Smith"),
+        ("O'Malley", "O'Malley"),
+        ("Smith-Jones", "Smith-Jones"),
+        ("J.R.", "J.R."),
+        ("José", "José"),
+        ("  Smith  ", "Smith"),
+    ])
+    def test_valid_player_name(self, raw, expected):
+        """Test valid player names are cleaned"""
+        assert validate_player_name(raw) == expected
+    
+    @pytest.mark.parametrize('raw,match', [
+        ("John Smith", _RE_SINGLE_WORD),
+        (_A31, _RE_MAX_30_CHARS),
+        ("", _RE_NON_EMPTY_STRING),
+        ("   ", _RE_EMPTY),
+        ("Smith@123", _RE_PLAYER_NAME_CHARS),
+    ])
+    def test_invalid_player_name(self, raw, match):
+        """Test invalid player names are rejected"""
+        with pytest.raises(ValueError, match=match):
+            validate_player_name(raw)
     
     def test_player_name_custom_field_name(self):
         """Test custom field name in error message"""
-        with pytest.raises(ValueError, match="firstName"):
+        with pytest.raises(ValueError, match=_RE_FIRST_NAME):
             validate_player_name("", field_name="firstName")
+    
+    @given(name=_PLAYER_NAME, pad=st.sampled_from(("", " ", "\t")))
+    def test_player_name_roundtrip(self, name, pad):
+        """Test any single-word name is returned trimmed and otherwise unchanged"""
+        assert validate_player_name(pad + name + pad) == name
+    
+    @given(first=_PLAYER_NAME, last=_PLAYER_NAME)
+    def test_player_name_rejects_multiple_words(self, first, last):
+        """Test any name containing an inner space is rejected"""
+        with pytest.raises(ValueError, match=_RE_SINGLE_WORD):
+            validate_player_name(f"{first} {last}")
 
 
 class TestValidatePlayerNumber:
     """Test validate_player_number function"""
     
-    def test_valid_player_numbers(self):
-        """Test valid player numbers"""
-        assert validate_player_number(0) == 0
-        assert validate_player_number(23) == 23
-        assert validate_player_number(99) == 99
-    
-    def test_player_number_from_string(self):
-        """Test player number from string"""
-        assert validate_player_number("42") == 42
-    
-    def test_player_number_out_of_range(self):
-        """Test player number out of range"""
-        with pytest.raises(ValueError, match="must be between 0 and 99"):
-            validate_player_number(-1)
-        with pytest.raises(ValueError):
-            validate_player_number(100)
-    
-    def test_player_number_invalid(self):
-        """Test invalid player number"""
-        with pytest.raises(ValueError, match="must be a valid integer"):
-            validate_player_number("abc")
-        with pytest.raises(ValueError):
-            validate_player_number(None)
+    @pytest.mark.parametrize('raw,expected', [
+        (0, 0),
+        (23, 23),
+        (99, 99),
+        ("42", 42),
+    ])
+    def test_valid_player_number(self, raw, expected):
+        """Test valid player numbers, including numeric strings"""
+        assert validate_player_number(raw) == expected
+    
+    @pytest.mark.parametrize('raw,match', [
+        (-1, _RE_PLAYER_NUMBER_RANGE),
+        (100, _RE_PLAYER_NUMBER_RANGE),
+        ("abc", _RE_NOT_INTEGER),
+        (None, _RE_NOT_INTEGER),
+    ])
+    def test_invalid_player_number(self, raw, match):
+        """Test out-of-range and non-integer player numbers"""
+        with pytest.raises(ValueError, match=match):
+            validate_player_number(raw)
 
 
-class TestValidatePlayerStatus:
-    """Test validate_player_status function"""
-    
-    def test_valid_statuses(self):
-        """Test valid player statuses"""
-        assert validate_player_status("active") == "active"
-        assert validate_player_status("inactive") == "inactive"
-        assert validate_player_status("sub") == "sub"
-    
-    def test_status_case_insensitive(self):
-        """Test status is case insensitive"""
-        assert validate_player_status("ACTIVE") == "active"
-        assert validate_player_status("InActive") == "inactive"
-    
-    def test_status_defaults_to_active(self):
-        """Test status defaults to active"""
-        assert validate_player_status(None) == "active"
-        assert validate_player_status("") == "active"
-    
-    def test_status_trims_whitespace(self):
-        """Test status trims whitespace"""
-        assert validate_player_status("  active  ") == "active"
-    
-    def test_invalid_status(self):
-        """Test invalid status"""
-        with pytest.raises(ValueError, match="must be one of"):
-            validate_player_status("unknown")
-    
-    def test_status_not_string(self):
-        """Test status not a string"""
-        with pytest.raises(ValueError, match="must be a string"):
-            validate_player_status(123)
+# validator, canonical values, default for None/"" (None when a value is required)
+_ENUM_VALIDATORS = (
+    (validate_player_status, ("active", "inactive", "sub"), "active"),
+    (validate_game_status, ("SCHEDULED", "IN_PROGRESS", "FINAL", "POSTPONED"), "SCHEDULED"),
+    (validate_team_type, ("MANAGED", "PERSONAL"), None),
+)
 
 
-class TestValidatePlayerPositions:
-    """Test validate_player_positions function"""
-    
-    def test_valid_positions(self):
-        """Test valid positions"""
-        assert validate_player_positions(["1B"]) == ["1B"]
-        assert validate_player_positions(["SS", "2B"]) == ["SS", "2B"]
-    
-    def test_positions_case_insensitive(self):
-        """Test positions are case insensitive"""
-        assert validate_player_positions(["1b", "ss"]) == ["1B", "SS"]
-    
-    def test_positions_removes_duplicates(self):
-        """Test positions removes duplicates"""
-        assert validate_player_positions(["1B", "1B"]) == ["1B"]
-        assert validate_player_positions(["ss", "SS"]) == ["SS"]
-    
-    def test_positions_empty_list(self):
-        """Test empty positions list"""
-        assert validate_player_positions([]) == []
-        assert validate_player_positions(None) == []
-    
-    def test_positions_too_many(self):
-        """Test too many positions"""
-        with pytest.raises(ValueError, match="maximum of 2 positions"):
-            validate_player_positions(["1B", "2B", "3B"])
-    
-    def test_positions_invalid(self):
-        """Test invalid positions"""
-        with pytest.raises(ValueError, match="Invalid position"):
-            validate_player_positions(["QB"])
-    
-    def test_positions_not_list(self):
-        """Test positions not a list"""
-        with pytest.raises(ValueError, match="must be an array"):
-            validate_player_positions("1B")
+def _enum_valid_cases():
+    """Each canonical value as-is, case-swapped and padded, plus defaults."""
+    for validator, values, default in _ENUM_VALIDATORS:
+        for value in values:
+            for raw in (value, value.swapcase(), f"  {value}  "):
+                yield pytest.param(validator, raw, value, id=f"{validator.__name__}-{raw!r}")
+        if default is not None:
+            for raw in (None, ""):
+                yield pytest.param(validator, raw, default, id=f"{validator.__name__}-{raw!r}")
 
 
-class TestValidateGameTitle:
-    """Test validate_game_title function"""
-    
-    def test_valid_game_title(self):
-        """Test valid game title"""
-        assert validate_game_title("Game vs Warriors") == "Game vs Warriors"
-    
-    def test_game_title_trims_whitespace(self):
-        """Test game title trims whitespace"""
-        assert validate_game_title("  Game  ") == "Game"
-    
-    def test_game_title_too_short(self):
-        """Test game title too short"""
-        with pytest.raises(ValueError, match="at least 3 characters"):
-            validate_game_title("AB")
-    
-    def test_game_title_too_long(self):
-        """Test game title too long"""
-        with pytest.raises(ValueError, match="must not exceed 100 characters"):
-            validate_game_title("A" * 101)
-    
-    def test_game_title_empty(self):
-        """Test empty game title"""
-        with pytest.raises(ValueError, match="Game title is required"):
-            validate_game_title("")
-        with pytest.raises(ValueError):
-            validate_game_title(None)
+def _enum_invalid_cases():
+    """Unknown and non-string values, plus missing values where one is required."""
+    for validator, values, default in _ENUM_VALIDATORS:
+        name = validator.__name__
+        yield pytest.param(validator, "unknown", _RE_NOT_ONE_OF, id=f"{name}-unknown")
+        yield pytest.param(validator, 123, _RE_NOT_STRING, id=f"{name}-not-string")
+        if default is None:
+            yield pytest.param(validator, None, _RE_TEAM_TYPE_REQUIRED, id=f"{name}-None")
+            yield pytest.param(validator, "", _RE_TEAM_TYPE_REQUIRED, id=f"{name}-empty")
 
 
-class TestValidateGameStatus:
-    """Test validate_game_status function"""
-    
-    def test_valid_game_statuses(self):
-        """Test valid game statuses"""
-        assert validate_game_status("scheduled") == "SCHEDULED"
-        assert validate_game_status("in_progress") == "IN_PROGRESS"
-        assert validate_game_status("FINAL") == "FINAL"
-        assert validate_game_status("POSTPONED") == "POSTPONED"
-    
-    def test_game_status_case_insensitive(self):
-        """Test game status is case insensitive"""
-        assert validate_game_status("SCHEDULED") == "SCHEDULED"
-        assert validate_game_status("scheduled") == "SCHEDULED"
-    
-    def test_game_status_defaults(self):
-        """Test game status defaults to SCHEDULED"""
-        assert validate_game_status(None) == "SCHEDULED"
-        assert validate_game_status("") == "SCHEDULED"
+class TestValidateEnumFields:
+    """Test validate_player_status, validate_game_status and validate_team_type"""
+    
+    @pytest.mark.parametrize('validator,raw,expected', list(_enum_valid_cases()))
+    def test_valid_value(self, validator, raw, expected):
+        """Test values are normalized to their canonical case, or defaulted"""
+        assert validator(raw) == expected
+    
+    @pytest.mark.parametrize('validator,raw,match', list(_enum_invalid_cases()))
+    def test_invalid_value(self, validator, raw, match):
+        """Test unknown, non-string and missing required values are rejected"""
+        with pytest.raises(ValueError, match=match):
+            validator(raw)
+
+
+# (input, expected) position cases; tuples so no case can be mutated by a test
+_POSITION_CASES = (
+    (("1B",), ("1B",)),
+    (("SS", "2B"), ("SS", "2B")),
+    # Case-insensitive, with duplicates removed
+    (("1b", "ss"), ("1B", "SS")),
+    (("1B", "1B"), ("1B",)),
+    (("ss", "SS"), ("SS",)),
+    ((), ()),
+    (None, ()),
+)
+
+
+class TestValidatePlayerPositions:
+    """Test validate_player_positions function"""
     
-    def test_invalid_game_status(self):
-        """Test invalid game status"""
-        with pytest.raises(ValueError, match="must be one of"):
-            validate_game_status("unknown")
+    @pytest.mark.parametrize('raw,expected', _POSITION_CASES)
+    def test_valid_positions(self, raw, expected):
+        """Test valid positions are normalized"""
+        assert tuple(validate_player_positions(raw)) == expected
+    
+    @pytest.mark.parametrize('raw,match', [
+        (("1B", "2B", "3B"), _RE_MAX_2_POSITIONS),
+        (("QB",), _RE_INVALID_POSITION),
+        ("1B", _RE_NOT_ARRAY),
+    ])
+    def test_invalid_positions(self, raw, match):
+        """Test invalid positions are rejected"""
+        with pytest.raises(ValueError, match=match):
+            validate_player_positions(raw)
 
 
 class TestValidateScore:
     """Test validate_score function"""
     
-    def test_valid_scores(self):
-        """Test valid scores"""
-        assert validate_score(0) == 0
-        assert validate_score(5) == 5
-        assert validate_score(50) == 50
-    
-    def test_score_from_string(self):
-        """Test score from string"""
-        assert validate_score("10") == 10
-    
-    def test_score_negative(self):
-        """Test negative score"""
-        with pytest.raises(ValueError, match="must be 0 or greater"):
-            validate_score(-1)
-    
-    def test_score_invalid(self):
-        """Test invalid score"""
-        with pytest.raises(ValueError, match="must be a valid integer"):
-            validate_score("abc")
-    
-    def test_score_none(self):
-        """Test None score raises ValueError"""
-        with pytest.raises(ValueError, match="must be a valid integer"):
-            validate_score(None)
+    @pytest.mark.parametrize('raw,expected', [
+        (0, 0),
+        (5, 5),
+        (50, 50),
+        ("10", 10),
+    ])
+    def test_valid_score(self, raw, expected):
+        """Test valid scores, including numeric strings"""
+        assert validate_score(raw) == expected
+    
+    @pytest.mark.parametrize('raw,match', [
+        (-1, _RE_NEGATIVE),
+        ("abc", _RE_NOT_INTEGER),
+        (None, _RE_NOT_INTEGER),
+    ])
+    def test_invalid_score(self, raw, match):
+        """Test negative and non-integer scores"""
+        with pytest.raises(ValueError, match=match):
+            validate_score(raw)
 
 
-class TestValidateTeamType:
-    """Test validate_team_type function"""
-    
-    def test_valid_team_types(self):
-        """Test valid team types"""
-        assert validate_team_type("MANAGED") == "MANAGED"
-        assert validate_team_type("PERSONAL") == "PERSONAL"
-    
-    def test_team_type_case_insensitive(self):
-        """Test team type is case insensitive"""
-        assert validate_team_type("managed") == "MANAGED"
-        assert validate_team_type("personal") == "PERSONAL"
-    
-    def test_team_type_requires_value(self):
-        """Test team type requires a value"""
-        with pytest.raises(ValueError, match="Team type is required"):
-            validate_team_type(None)
-        with pytest.raises(ValueError, match="Team type is required"):
-            validate_team_type("")
-    
-    def test_invalid_team_type(self):
-        """Test invalid team type"""
-        with pytest.raises(ValueError, match="must be one of"):
-            validate_team_type("UNKNOWN")
+_LINEUP_POSITIONS = ("1B", "SS", "2B", "3B", "OF", "C", "P", "DH", "UTIL")
+
+
+@pytest.fixture
+def make_lineup():
+    """
+    Factory for lineups of n players batting 1..n.
+    
+    Keyword arguments override fields on the first entry.
+    """
+    def _make(n=2, **overrides):
+        lineup = [
+            {
+                "playerId": f"player-{i + 1}",
+                "battingOrder": i + 1,
+                "position": _LINEUP_POSITIONS[i % len(_LINEUP_POSITIONS)]
+            }
+            for i in range(n)
+        ]
+        lineup[0].update(overrides)
+        return lineup
+    return _make
 
 
 class TestValidateLineup:
     """Test validate_lineup function"""
     
-    def test_valid_lineup(self):
+    def test_valid_lineup(self, make_lineup):
         """Test valid lineup"""
-        lineup = [
-            {"playerId": "player-1", "battingOrder": 1, "position": "1B"},
-            {"playerId": "player-2", "battingOrder": 2, "position": "SS"}
-        ]
-        result = validate_lineup(lineup)
+        result = validate_lineup(make_lineup(2))
         assert len(result) == 2
         assert result[0]["battingOrder"] == 1
     
-    def test_lineup_empty(self):
+    @pytest.mark.parametrize('raw', [[], None])
+    def test_lineup_empty(self, raw):
         """Test empty lineup"""
-        assert validate_lineup([]) == []
-        assert validate_lineup(None) == []
-    
-    def test_lineup_not_list(self):
-        """Test lineup not a list"""
-        with pytest.raises(ValueError, match="must be a list"):
-            validate_lineup("not a list")
-    
-    def test_lineup_invalid_player(self):
-        """Test lineup with invalid player object"""
-        with pytest.raises(ValueError, match="missing 'playerId'"):
-            validate_lineup([{"battingOrder": 1}])
-    
-    def test_lineup_duplicate_batting_order(self):
+        assert validate_lineup(raw) == []
+    
+    @pytest.mark.parametrize('raw,match', [
+        ("not a list", _RE_NOT_LIST),
+        ([{"battingOrder": 1}], _RE_MISSING_PLAYER_ID),
+    ], ids=['not-list', 'missing-playerId'])
+    def test_invalid_lineup(self, raw, match):
+        """Test malformed lineups are rejected"""
+        with pytest.raises(ValueError, match=match):
+            validate_lineup(raw)
+    
+    def test_lineup_duplicate_batting_order(self, make_lineup):
         """Test lineup with duplicate batting order"""
-        lineup = [
-            {"playerId": "player-1", "battingOrder": 1, "position": "1B"},
-            {"playerId": "player-2", "battingOrder": 1, "position": "SS"}
-        ]
-        with pytest.raises(ValueError, match="Duplicate batting order"):
+        lineup = make_lineup(2)
+        lineup[1]["battingOrder"] = 1
+        with pytest.raises(ValueError, match=_RE_DUPLICATE_BATTING_ORDER):
             validate_lineup(lineup)
     
-    def test_lineup_invalid_batting_order(self):
+    def test_lineup_invalid_batting_order(self, make_lineup):
         """Test lineup with invalid batting order"""
-        lineup = [
-            {"playerId": "player-1", "battingOrder": 0, "position": "1B"}
-        ]
-        with pytest.raises(ValueError, match="must be 1 or greater"):
-            validate_lineup(lineup)
+        with pytest.raises(ValueError, match=_RE_BELOW_ONE):
+            validate_lineup(make_lineup(1, battingOrder=0))
     
-    def test_lineup_with_optional_fields(self):
+    def test_lineup_with_optional_fields(self, make_lineup):
         """Test lineup with optional fields"""
-        lineup = [
-            {"playerId": "player-1", "battingOrder": 1, "position": "1B"}
-        ]
-        result = validate_lineup(lineup)
+        result = validate_lineup(make_lineup(1))
         assert result[0]["playerId"] == "player-1"
         assert result[0]["battingOrder"] == 1
 
+
+@pytest.mark.smoke
+class TestValidationSmoke:
+    """One representative happy-path case per validator (run with -m smoke)"""
+    
+    @pytest.mark.parametrize('validator,raw,expected', [
+        pytest.param(validate_team_name, "  The    Best Team ", "The Best Team", id='team_name'),
+        pytest.param(validate_team_description, "  A great team  ", "A great team", id='team_description'),
+        pytest.param(validate_player_name, " O'Malley ", "O'Malley", id='player_name'),
+        pytest.param(validate_player_number, "42", 42, id='player_number'),
+        pytest.param(validate_player_status, "InActive", "inactive", id='player_status'),
+        pytest.param(validate_player_positions, ("ss", "1B"), ["SS", "1B"], id='player_positions'),
+        pytest.param(validate_game_status, "in_progress", "IN_PROGRESS", id='game_status'),
+        pytest.param(validate_score, "10", 10, id='score'),
+        pytest.param(validate_team_type, "managed", "MANAGED", id='team_type'),
+        pytest.param(
+            validate_lineup,
+            [{"playerId": " player-1 ", "battingOrder": "1"}],
+            [{"playerId": "player-1", "battingOrder": 1}],
+            id='lineup'
+        ),
+    ])
+    def test_validator_smoke(self, validator, raw, expected):
+        """Test each validator accepts and normalizes a typical input"""
+        assert validator(raw) == expected